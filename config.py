@@ -6,12 +6,15 @@ Loads configuration from YAML file with sensible defaults.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when available, falling back to pure Python
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Default configuration values
 DEFAULTS = {
     "watch_directory": "~/Downloads",
@@ -22,6 +25,11 @@ DEFAULTS = {
     "debounce_seconds": 2,
 }
 
+# Loaded configs keyed by config_path, stored with the (mtime_ns, size) they
+# were parsed at, so repeated loads in the same process skip opening and
+# re-parsing an unchanged file and an edited file replaces its entry
+_config_cache: Dict[Path, Tuple[Tuple[int, int], "Config"]] = {}
+
 
 class Config:
     """Configuration container with validation and path expansion."""
@@ -61,10 +69,13 @@ class Config:
 
     def _expand_paths(self):
         """Expand ~ and environment variables in path configurations."""
-        path_keys = ["watch_directory", "output_directory", "log_file"]
-        for key in path_keys:
-            if key in self._config:
-                self._config[key] = Path(self._config[key]).expanduser().resolve()
+        # Only the watched directory needs a canonical path; destination
+        # paths may not exist yet and skip the costly resolve()
+        self._config["watch_directory"] = (
+            Path(self._config["watch_directory"]).expanduser().resolve(strict=False)
+        )
+        for key in ["output_directory", "log_file"]:
+            self._config[key] = Path(self._config[key]).expanduser()
 
     @property
     def watch_directory(self) -> Path:
@@ -120,22 +131,37 @@ def load_config(config_path: Path = None) -> Config:
         # Look for config.yaml in same directory as this script
         config_path = Path(__file__).parent / "config.yaml"
 
-    if not config_path.exists():
+    # A single stat both checks existence and revalidates the cache
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         logger.warning(
             f"Config file not found at {config_path}. Using defaults: {DEFAULTS}"
         )
         return Config({})
 
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     logger.info(f"Loading configuration from {config_path}")
 
     try:
         with open(config_path, "r") as f:
-            config_dict = yaml.safe_load(f) or {}
+            config_dict = yaml.load(f, Loader=Loader) or {}
     except yaml.YAMLError as e:
         logger.error(f"Failed to parse config file: {e}")
         raise
 
-    return Config(config_dict)
+    config = Config(config_dict)
+    _config_cache[config_path] = (signature, config)
+    return config
+
+
+def clear_config_cache():
+    """Forget all previously loaded configurations."""
+    _config_cache.clear()
 
 
 def create_example_config(output_path: Path = None):
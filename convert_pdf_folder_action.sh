@@ -12,19 +12,25 @@ source "$SCRIPT_DIR/venv/bin/activate"
 LOG_FILE="$HOME/Library/Logs/pdf-to-md.log"
 mkdir -p "$(dirname "$LOG_FILE")"
 
-# Process each file passed by Folder Action
+# Collect the PDF files passed by Folder Action
+pdfs=()
 for file in "$@"; do
     # Only process PDF files
     if [[ "$file" == *.pdf ]] || [[ "$file" == *.PDF ]]; then
         echo "[$(date '+%Y-%m-%d %H:%M:%S')] Processing: $file" >> "$LOG_FILE"
-        
-        # Run the conversion using our existing converter
-        python3 "$SCRIPT_DIR/convert_single_pdf.py" "$file" >> "$LOG_FILE" 2>&1
-        
-        if [ $? -eq 0 ]; then
-            echo "[$(date '+%Y-%m-%d %H:%M:%S')] ✓ Successfully converted: $file" >> "$LOG_FILE"
-        else
-            echo "[$(date '+%Y-%m-%d %H:%M:%S')] ✗ Failed to convert: $file" >> "$LOG_FILE"
-        fi
+        pdfs+=("$file")
     fi
 done
+
+if [ ${#pdfs[@]} -eq 0 ]; then
+    exit 0
+fi
+
+# Convert the whole batch in a single Python process
+python3 "$SCRIPT_DIR/convert_single_pdf.py" "${pdfs[@]}" >> "$LOG_FILE" 2>&1
+
+if [ $? -eq 0 ]; then
+    echo "[$(date '+%Y-%m-%d %H:%M:%S')] ✓ Successfully converted ${#pdfs[@]} file(s)" >> "$LOG_FILE"
+else
+    echo "[$(date '+%Y-%m-%d %H:%M:%S')] ✗ Failed to convert one or more of ${#pdfs[@]} file(s)" >> "$LOG_FILE"
+fi
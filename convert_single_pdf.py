@@ -1,59 +1,135 @@
 #!/usr/bin/env python3
 """
 Single PDF converter for Folder Actions.
-Called by convert_pdf_folder_action.sh when a PDF is added to watched folder.
+Called by convert_pdf_folder_action.sh with every PDF added to the watched
+folder in one batch, so config and converter setup is shared between files.
 """
 
+import functools
+import itertools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, Iterator, TextIO
 
 from config import load_config
-from converters import get_converter
+from converters import PDFConverter, get_converter
+
+PDF_SUFFIX = ".pdf"
+
+
+def _output_names(stem: str) -> Iterator[str]:
+    """Yield candidate markdown file names for a PDF, most preferred first."""
+    yield f"{stem}.md"
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    yield f"{stem}_{timestamp}.md"
+    for n in itertools.count(1):
+        yield f"{stem}_{timestamp}_{n}.md"
+
+
+def open_output_file(output_dir: Path, stem: str) -> TextIO:
+    """
+    Create a new markdown file for a PDF without overwriting existing output.
+
+    Every name is claimed with exclusive creation, so concurrent conversions
+    never share or truncate a file. The output directory is only created
+    when it turns out to be missing. If <stem>.md is already taken, a
+    timestamp (and then a counter) is appended to the name.
+    """
+    names = _output_names(stem)
+    name = next(names)
+    while True:
+        try:
+            return open(output_dir / name, "x", encoding="utf-8")
+        except FileNotFoundError:
+            if output_dir.is_dir():
+                raise
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except FileExistsError:
+            name = next(names)
+
+
+def convert_pdf(pdf_path: Path, converter: PDFConverter, output_dir: Path) -> Path:
+    """Convert one PDF into output_dir and return the markdown file path."""
+    # Convert, streaming markdown straight into the output file
+    print(f"Converting {pdf_path.name} using {converter.name}...")
+    out = open_output_file(output_dir, pdf_path.stem)
+    output_path = Path(out.name)
+    try:
+        with out:
+            converter.convert_to_stream(pdf_path, out)
+    except Exception:
+        # Don't leave a partially written file behind
+        output_path.unlink(missing_ok=True)
+        raise
+
+    return output_path
+
+
+def _convert_one(pdf_path: Path, method: str, output_dir: Path) -> Path:
+    """Worker entry point: convert one PDF in a separate process."""
+    return convert_pdf(pdf_path, get_converter(method), output_dir)
+
+
+def _report(pdf_path: Path, convert: Callable[[], Path]) -> bool:
+    """Run a conversion, print its outcome and return whether it succeeded."""
+    try:
+        output_path = convert()
+    except Exception as e:
+        print(f"✗ Failed to convert {pdf_path.name}: {e}")
+        return False
+
+    print(f"✓ Saved to: {output_path}")
+    return True
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: convert_single_pdf.py <path-to-pdf>")
+        print("Usage: convert_single_pdf.py <path-to-pdf> [<path-to-pdf> ...]")
         sys.exit(1)
 
-    pdf_path = Path(sys.argv[1]).resolve()
-    
-    if not pdf_path.exists():
-        print(f"Error: File not found: {pdf_path}")
-        sys.exit(1)
+    failed = False
+    pdf_paths = []
+    for src in sys.argv[1:]:
+        # Cheap string check first so non-PDF files never touch the filesystem
+        if not src.lower().endswith(PDF_SUFFIX):
+            print(f"Skipping non-PDF file: {src}")
+            continue
 
-    if pdf_path.suffix.lower() != ".pdf":
-        print(f"Skipping non-PDF file: {pdf_path}")
-        sys.exit(0)
-
-    # Load config
-    config = load_config()
-    
-    # Get converter
-    converter = get_converter(config.conversion_method)
-    
-    # Convert
-    print(f"Converting {pdf_path.name} using {converter.name}...")
-    markdown = converter.convert(pdf_path)
-    
-    # Create output directory
-    config.output_directory.mkdir(parents=True, exist_ok=True)
-    
-    # Generate output filename
-    output_name = f"{pdf_path.stem}.md"
-    output_path = config.output_directory / output_name
-    
-    # If file exists, append timestamp
-    if output_path.exists():
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_name = f"{pdf_path.stem}_{timestamp}.md"
-        output_path = config.output_directory / output_name
-    
-    # Write markdown
-    output_path.write_text(markdown, encoding='utf-8')
-    
-    print(f"✓ Saved to: {output_path}")
+        pdf_path = Path(src).resolve()
+        
+        if not pdf_path.exists():
+            print(f"Error: File not found: {pdf_path}")
+            failed = True
+            continue
+
+        pdf_paths.append(pdf_path)
+
+    if pdf_paths:
+        config = load_config()
+        method = config.conversion_method
+        output_dir = config.output_directory
+
+        if method == "pdfplumber" and len(pdf_paths) > 1:
+            # pdfplumber is CPU-bound, so spread the batch across cores.
+            # marker-pdf stays in-process to share its models and the GPU.
+            workers = min(len(pdf_paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                jobs = [
+                    (pdf_path, executor.submit(_convert_one, pdf_path, method, output_dir))
+                    for pdf_path in pdf_paths
+                ]
+                for pdf_path, job in jobs:
+                    failed |= not _report(pdf_path, job.result)
+        else:
+            converter = get_converter(method)
+            for pdf_path in pdf_paths:
+                convert = functools.partial(convert_pdf, pdf_path, converter, output_dir)
+                failed |= not _report(pdf_path, convert)
+
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
@@ -5,10 +5,12 @@ Provides an abstract base class and concrete implementations for converting
 PDF files to Markdown format using different extraction methods.
 """
 
+import functools
+import io
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,22 @@ class PDFConverter(ABC):
         """
         pass
 
+    def convert_to_stream(self, pdf_path: Path, out: TextIO) -> None:
+        """
+        Convert a PDF file to Markdown, writing the result to a text stream.
+
+        The default implementation writes the output of convert(); converters
+        that can produce output incrementally should override this.
+
+        Args:
+            pdf_path: Path to the PDF file to convert
+            out: Writable text stream receiving the Markdown
+
+        Raises:
+            Exception: If conversion fails
+        """
+        out.write(self.convert(pdf_path))
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -44,7 +62,8 @@ class PdfPlumberConverter(PDFConverter):
     Fast text-based PDF converter using pdfplumber.
     
     Good for text-based PDFs. Fast and lightweight, but doesn't handle
-    complex layouts, images, or scanned documents well.
+    complex layouts, images, or scanned documents well; use marker-pdf for
+    layout-critical documents.
     """
 
     def __init__(self):
@@ -68,34 +87,45 @@ class PdfPlumberConverter(PDFConverter):
         Extracts text page-by-page and formats with page separators.
         Attempts to preserve basic table structure.
         """
+        buf = io.StringIO()
+        self.convert_to_stream(pdf_path, buf)
+        return buf.getvalue()
+
+    def convert_to_stream(self, pdf_path: Path, out: TextIO) -> None:
+        """
+        Convert PDF to Markdown using pdfplumber, writing page by page.
+
+        Each page is written to the stream as soon as it is extracted, so the
+        full document is never held in memory.
+        """
         logger.info(f"Converting {pdf_path.name} using pdfplumber...")
 
-        markdown_content = []
-        markdown_content.append(f"# {pdf_path.stem}\n")
-        markdown_content.append(f"*Converted from: {pdf_path.name}*\n")
-        markdown_content.append("---\n\n")
+        out.write(f"# {pdf_path.stem}\n*Converted from: {pdf_path.name}*\n---\n\n")
 
         try:
             with self._pdfplumber.open(pdf_path) as pdf:
                 total_pages = len(pdf.pages)
-                logger.debug(f"Processing {total_pages} pages...")
+                logger.debug("Processing %d pages...", total_pages)
 
                 for page_num, page in enumerate(pdf.pages, start=1):
                     # Extract text
                     text = page.extract_text()
                     
                     if text:
-                        markdown_content.append(f"## Page {page_num}\n\n")
-                        markdown_content.append(text)
-                        markdown_content.append("\n\n")
+                        out.write(f"## Page {page_num}\n\n{text}\n\n")
                     
-                    # Try to extract tables
+                    # Table detection looks for ruling lines, so skip the
+                    # expensive extraction on pages that have none
+                    if not page.edges:
+                        continue
+
                     tables = page.extract_tables()
                     if tables:
-                        for table_num, table in enumerate(tables, start=1):
-                            markdown_content.append(f"### Table {table_num} (Page {page_num})\n\n")
-                            markdown_content.append(self._table_to_markdown(table))
-                            markdown_content.append("\n\n")
+                        out.write("".join([
+                            f"### Table {table_num} (Page {page_num})\n\n"
+                            f"{self._table_to_markdown(table)}\n\n"
+                            for table_num, table in enumerate(tables, start=1)
+                        ]))
 
                 logger.info(f"Successfully converted {total_pages} pages")
 
@@ -103,30 +133,38 @@ class PdfPlumberConverter(PDFConverter):
             logger.error(f"Failed to convert {pdf_path.name}: {e}")
             raise
 
-        return "".join(markdown_content)
-
     def _table_to_markdown(self, table: list) -> str:
         """Convert a table array to Markdown table format."""
         if not table or not table[0]:
             return ""
 
-        lines = []
-        
-        # Header row
+        # Header row and separator
         header = table[0]
-        lines.append("| " + " | ".join(str(cell or "") for cell in header) + " |")
-        
-        # Separator
-        lines.append("| " + " | ".join("---" for _ in header) + " |")
-        
-        # Data rows
-        for row in table[1:]:
-            if row:  # Skip empty rows
-                lines.append("| " + " | ".join(str(cell or "") for cell in row) + " |")
-        
+        ncols = len(header)
+        lines = [
+            "| " + " | ".join("" if cell is None else str(cell) for cell in header) + " |",
+            "| " + " | ".join(["---"] * ncols) + " |",
+        ]
+
+        # Data rows, skipping empty ones
+        lines.extend([
+            "| " + " | ".join("" if cell is None else str(cell) for cell in row) + " |"
+            for row in table[1:]
+            if row
+        ])
+
         return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_marker_models():
+    """Load marker-pdf models once per process."""
+    from marker.models import load_all_models
+
+    logger.debug("Loading marker-pdf models (first time only)...")
+    return load_all_models()
+
+
 class MarkerPdfConverter(PDFConverter):
     """
     High-quality PDF converter using marker-pdf.
@@ -138,10 +176,8 @@ class MarkerPdfConverter(PDFConverter):
     def __init__(self):
         try:
             from marker.convert import convert_single_pdf
-            from marker.models import load_all_models
+            from marker.models import load_all_models  # noqa: F401
             self._convert_single_pdf = convert_single_pdf
-            self._load_all_models = load_all_models
-            self._models = None
         except ImportError:
             raise ImportError(
                 "marker-pdf is required for this converter. "
@@ -157,24 +193,20 @@ class MarkerPdfConverter(PDFConverter):
         Convert PDF to Markdown using marker-pdf.
 
         Uses ML models for better layout detection and text extraction.
-        Loads models on first use and caches them.
+        Models are loaded on first use and shared by all converters in the
+        process.
         """
         logger.info(f"Converting {pdf_path.name} using marker-pdf...")
 
         try:
-            # Load models on first use
-            if self._models is None:
-                logger.debug("Loading marker-pdf models (first time only)...")
-                self._models = self._load_all_models()
-
             # Convert the PDF
             markdown_content, metadata = self._convert_single_pdf(
                 str(pdf_path),
-                self._models
+                _load_marker_models()
             )
 
             logger.info(f"Successfully converted {pdf_path.name}")
-            logger.debug(f"Metadata: {metadata}")
+            logger.debug("Metadata: %s", metadata)
 
             return markdown_content
 